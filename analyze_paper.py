@@ -5,11 +5,13 @@ Usage: python analyze_paper.py <path_to_pdf>
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent
+
 # Add project root for imports
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(ROOT))
 
 from miner import get_p_values
-from stats import analyze_p_values, summarize_p_values
+from stats import compute_stats
 
 
 def main():
@@ -25,14 +27,13 @@ def main():
         print("Error: expected a .pdf file")
         sys.exit(1)
 
-    p_values = get_p_values(pdf_path)
+    p_values = get_p_values(pdf_path, cache_dir=ROOT / ".pv_cache")
 
     if not p_values:
         print(f"No p-values extracted from {pdf_path.name}")
         score, status = 100, "No p-values in 0-0.05"
     else:
-        score, status = analyze_p_values(p_values)
-        summary = summarize_p_values(p_values)
+        score, status, summary = compute_stats(p_values)
         print(f"Extracted {len(p_values)} p-value(s); in [0, 0.05] window: {summary['filtered_count']}")
         print(f"  Risky (0.04-0.05): {summary['risky_count']}, Highly sig (<=0.01): {summary['high_sig_count']}")
         print(f"  Risk ratio: {summary['risk_ratio']:.3f}")
@@ -10,7 +10,7 @@ ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT))
 
 from miner import get_p_values
-from stats import analyze_p_values, summarize_p_values
+from stats import compute_stats
 
 
 def run_pipeline(pdf_path: Path) -> int:
@@ -22,16 +22,17 @@ def run_pipeline(pdf_path: Path) -> int:
         print("Error: expected a .pdf file")
         return 1
 
-    # 1. Miner: text extraction -> p-values (PDF opened inside miner)
-    p_values = get_p_values(pdf_path)
+    # 1. Miner: text extraction -> p-values (PDF opened inside miner).
+    # Content-addressed cache makes repeat runs on the same PDF near-instant.
+    p_values = get_p_values(pdf_path, cache_dir=ROOT / ".pv_cache")
 
     if not p_values:
         print(f"No p-values extracted from {pdf_path.name}")
         score, status = 100, "No p-values in 0-0.05"
     else:
         # 2. Stats: uses every detected p-value; score is based on [0, 0.05] (p-curve standard).
-        score, status = analyze_p_values(p_values)
-        summary = summarize_p_values(p_values)
+        # Single pass gives us both the score and the summary counts.
+        score, status, summary = compute_stats(p_values)
         total = summary["total_count"]
         in_window = summary["filtered_count"]
         above = summary["count_above_005"]
@@ -45,6 +45,55 @@ or outcome) could be added later for finer-grained credibility assessment.
 from typing import Iterable, Tuple, Dict
 
 
+def compute_stats(p_values: Iterable[float]) -> Tuple[int, str, Dict[str, float]]:
+    """Single O(n) sweep over p_values; returns (score, status, summary).
+
+    Both public helpers wrap this so the data is only traversed once even
+    when a caller (e.g. main.run_pipeline) needs the score AND the summary.
+    """
+    total = in_window = above = risky_count = high_sig_count = 0
+    for p in p_values:
+        if p is None:
+            continue
+        p = float(p)
+        total += 1
+        if p > 0.05:
+            above += 1
+        elif 0.0 <= p <= 0.05:
+            in_window += 1
+            if p >= 0.04:
+                risky_count += 1
+            if p <= 0.01:
+                high_sig_count += 1
+
+    # Avoid division by zero; if there are no highly significant values,
+    # treat denominator as 1 so ratio grows proportionally to risky_count.
+    denom = high_sig_count if high_sig_count > 0 else 1
+    risk_ratio = risky_count / denom
+
+    if in_window == 0:
+        score, status = 100, "No p-values in 0-0.05"
+    else:
+        # Map ratio -> score in a smooth way: score = 100 / (1 + ratio)
+        score = int(round(100 * (1.0 / (1.0 + risk_ratio))))
+        if score < 40:
+            status = "High Risk"
+        elif score < 70:
+            status = "Moderate Risk"
+        else:
+            status = "Likely Reliable"
+
+    summary = {
+        "total_count": total,
+        "filtered_count": in_window,
+        "count_above_005": above,
+        "risky_count": risky_count,
+        "high_sig_count": high_sig_count,
+        "risk_ratio": risk_ratio,
+    }
+    return score, status, summary
+
+
 def analyze_p_values(p_values: Iterable[float]) -> Tuple[int, str]:
     """Analyze a sequence of p-values and return (integrity_score, status).
 
@@ -56,31 +105,7 @@ def analyze_p_values(p_values: Iterable[float]) -> Tuple[int, str]:
             status is one of: 'No p-values in 0-0.05', 'High Risk',
             'Moderate Risk', 'Likely Reliable'.
     """
-    filtered = [float(p) for p in p_values if p is not None]
-    # Keep only values within the conventional p-curve window
-    window = [p for p in filtered if 0.0 <= p <= 0.05]
-
-    if len(window) == 0:
-        return 100, "No p-values in 0-0.05"
-
-    risky_count = sum(1 for p in window if 0.04 <= p <= 0.05)
-    high_sig_count = sum(1 for p in window if p <= 0.01)
-
-    # Avoid division by zero; if there are no highly significant values,
-    # treat denominator as 1 so ratio grows proportionally to risky_count.
-    denom = high_sig_count if high_sig_count > 0 else 1
-    risk_ratio = risky_count / denom
-
-    # Map ratio -> score in a smooth way: score = 100 / (1 + ratio)
-    score = int(round(100 * (1.0 / (1.0 + risk_ratio))))
-
-    if score < 40:
-        status = "High Risk"
-    elif score < 70:
-        status = "Moderate Risk"
-    else:
-        status = "Likely Reliable"
-
+    score, status, _ = compute_stats(p_values)
     return score, status
 
 
@@ -90,21 +115,7 @@ def summarize_p_values(p_values: Iterable[float]) -> Dict[str, float]:
     Uses every detected p-value: total_count and count_above_005 include values > 0.05.
     The integrity score (risk_ratio, etc.) is based only on [0, 0.05] per p-curve methodology.
     """
-    filtered = [float(p) for p in p_values if p is not None]
-    window = [p for p in filtered if 0.0 <= p <= 0.05]
-    above_005 = [p for p in filtered if p > 0.05]
-    risky_count = sum(1 for p in window if 0.04 <= p <= 0.05)
-    high_sig_count = sum(1 for p in window if p <= 0.01)
-    denom = high_sig_count if high_sig_count > 0 else 1
-    risk_ratio = risky_count / denom
-    return {
-        "total_count": len(filtered),
-        "filtered_count": len(window),
-        "count_above_005": len(above_005),
-        "risky_count": risky_count,
-        "high_sig_count": high_sig_count,
-        "risk_ratio": risk_ratio,
-    }
+    return compute_stats(p_values)[2]
 
 
 if __name__ == "__main__":
@@ -17,10 +17,22 @@ import os
 from pathlib import Path
 import tempfile
 import pytest
-import matplotlib.pyplot as plt
-import numpy as np
 import fitz  # PyMuPDF - used for miner integration tests
 
+import matplotlib
+
+# Non-interactive backend: under pytest/CI there is no display, and a GUI
+# backend would block on plt.show() or pay for canvas construction. Selecting
+# Agg here takes effect when pyplot is lazily imported below.
+matplotlib.use("Agg")
+
+# Only pop figures up when someone runs this file from a real terminal.
+_INTERACTIVE = sys.stdout.isatty()
+
+# NOTE: matplotlib.pyplot (~300ms import + font-cache scan) and numpy are only
+# needed by a couple of tests, so they are imported locally where used instead
+# of at module load — keeps every other pytest invocation fast.
+
 # Fix import: add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -65,6 +77,8 @@ def test_right_skew_mathematical_property():
     a beta distribution skewed toward zero. The ratio of marginal (0.04-0.05)
     to highly significant (<=0.01) should be << 1.
     """
+    import numpy as np
+
     # Synthetic right-skewed distribution
     p_values = (
         np.random.beta(0.5, 5, 500) * 0.05  # Beta(0.5, 5) skewed right, scaled to [0, 0.05]
@@ -315,42 +329,65 @@ def test_miner_extracted_p_values_through_stats_sample_pdf():
 def visualize_comparison(save_path=None):
     """Generate comprehensive p-curve visualizations.
 
-    Creates 3 figures:
-    1. Side-by-side legitimate vs. p-hacked distributions
-    2. Distribution shapes with region annotations
-    3. Risk ratio to score mapping charts
+    Creates one 3x2 figure (single render + single PNG encode):
+    row 1: side-by-side legitimate vs. p-hacked distributions
+    row 2: distribution shapes with region annotations
+    row 3: risk ratio to score mapping charts
 
     Args:
-        save_path: If provided, saves figures to this directory. Otherwise displays inline.
+        save_path: If provided, saves the figure to this directory. Otherwise displays inline.
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     print("\n" + "=" * 80)
     print("P-CURVE VISUALIZATION: Detecting P-Hacking")
     print("=" * 80)
 
-    # Generate samples
+    # Generate samples. The Generator API is faster than the legacy np.random
+    # globals, and seeding makes the figures (and the score assertion below)
+    # reproducible run to run.
+    rng = np.random.default_rng(0)
+
     print("\n[1] Generating Legitimate (Right-Skewed) Distribution...")
-    legitimate = np.random.beta(0.5, 5, 200) * 0.05
-    legitimate = np.clip(legitimate, 0.0001, 0.05)
+    legitimate = np.clip(rng.beta(0.5, 5, 200) * 0.05, 0.0001, 0.05)
     score_legit, status_legit = analyze_p_values(legitimate)
     summary_legit = summarize_p_values(legitimate)
     print(f"    ✓ Score: {score_legit}/100, Status: {status_legit}")
     print(f"    ✓ Risk Ratio: {summary_legit['risk_ratio']:.3f}")
 
     print("\n[2] Generating P-Hacked (Bump at 0.05) Distribution...")
-    phacked = np.concatenate([
-        np.random.uniform(0.044, 0.050, 150),
-        np.random.uniform(0.001, 0.02, 50),
-    ])
+    # Fill one preallocated buffer in two slices — no np.concatenate copy.
+    phacked = np.empty(200)
+    phacked[:150] = rng.uniform(0.044, 0.050, 150)
+    phacked[150:] = rng.uniform(0.001, 0.02, 50)
     score_phack, status_phack = analyze_p_values(phacked)
     summary_phack = summarize_p_values(phacked)
     print(f"    ✗ Score: {score_phack}/100, Status: {status_phack}")
     print(f"    ✗ Risk Ratio: {summary_phack['risk_ratio']:.3f}")
 
-    # Figure 1: Comparison
-    print("\n[3] Creating Figure 1: Side-by-Side Comparison...")
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    # Bin each dataset once; every histogram panel below reuses these counts
+    # instead of letting matplotlib re-bin the same array per axis.
+    counts_legit, edges = np.histogram(legitimate, bins=10, range=(0, 0.05))
+    counts_phack, _ = np.histogram(phacked, bins=10, range=(0, 0.05))
+
+    def _bar(ax, counts, color):
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+               color=color, alpha=0.7, edgecolor="black", linewidth=1.5)
 
-    ax1.hist(legitimate, bins=10, color="green", alpha=0.7, edgecolor="black", linewidth=1.5)
+    # One figure, six panels: three separate figures each paid their own
+    # layout solve, render pass and PNG encode — the encode dominates at
+    # dpi=150, so a single savefig cuts that cost to a third.
+    # constrained_layout solves spacing incrementally during draw — cheaper
+    # than a tight_layout pass plus the extra layout rerun a bbox_inches
+    # "tight" savefig would trigger.
+    fig, axes = plt.subplots(3, 2, figsize=(14, 15), constrained_layout=True)
+
+    # Row 1: Comparison
+    print("\n[3] Creating Row 1: Side-by-Side Comparison...")
+    ax1, ax2 = axes[0]
+
+    _bar(ax1, counts_legit, "green")
     ax1.axvline(0.01, color="red", linestyle="--", linewidth=2, label="p=0.01")
     ax1.axvline(0.05, color="orange", linestyle="--", linewidth=2, label="p=0.05")
     ax1.set_title(
@@ -361,13 +398,16 @@ def visualize_comparison(save_path=None):
     ax1.set_ylabel("Frequency")
     ax1.legend()
     ax1.grid(alpha=0.3)
+    # Axes-fraction coordinates: no get_ylim call, so no forced autoscale
+    # reconciliation just to place a label.
     ax1.text(
-        0.025, max(ax1.get_ylim()) * 0.9,
+        0.5, 0.9,
         f"Risk Ratio: {summary_legit['risk_ratio']:.3f}",
+        transform=ax1.transAxes, ha="center",
         fontsize=10, bbox=dict(boxstyle="round", facecolor="lightgreen", alpha=0.8)
     )
 
-    ax2.hist(phacked, bins=10, color="red", alpha=0.7, edgecolor="black", linewidth=1.5)
+    _bar(ax2, counts_phack, "red")
     ax2.axvline(0.01, color="green", linestyle="--", linewidth=2, label="p=0.01")
     ax2.axvline(0.05, color="orange", linestyle="--", linewidth=2, label="p=0.05")
     ax2.set_title(
@@ -379,24 +419,17 @@ def visualize_comparison(save_path=None):
     ax2.legend()
     ax2.grid(alpha=0.3)
     ax2.text(
-        0.025, max(ax2.get_ylim()) * 0.9,
+        0.5, 0.9,
         f"Risk Ratio: {summary_phack['risk_ratio']:.3f}",
+        transform=ax2.transAxes, ha="center",
         fontsize=10, bbox=dict(boxstyle="round", facecolor="lightcoral", alpha=0.8)
     )
 
-    plt.suptitle("P-Curve Detection: Legitimate vs. P-Hacked", fontsize=14, fontweight="bold")
-    plt.tight_layout()
-    if save_path:
-        fig.savefig(Path(save_path) / "figure1_comparison.png", dpi=150, bbox_inches="tight")
-        print(f"    ✓ Saved: figure1_comparison.png")
-    plt.show()
-    plt.close()
-
-    # Figure 2: Distribution shapes
-    print("\n[4] Creating Figure 2: Distribution Shapes...")
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    # Row 2: Distribution shapes
+    print("\n[4] Creating Row 2: Distribution Shapes...")
+    ax1, ax2 = axes[1]
 
-    ax1.hist(legitimate, bins=10, color="green", alpha=0.7, edgecolor="black", linewidth=1.5)
+    _bar(ax1, counts_legit, "green")
     ax1.axvspan(0.0, 0.01, alpha=0.2, color="blue", label="Highly Sig (p≤0.01)")
     ax1.axvspan(0.04, 0.05, alpha=0.2, color="red", label="Risky (0.04-0.05)")
     ax1.set_title("Legitimate: RIGHT-SKEWED\n(Natural decline)", fontsize=12, fontweight="bold")
@@ -405,7 +438,7 @@ def visualize_comparison(save_path=None):
     ax1.legend()
     ax1.grid(alpha=0.3, axis="y")
 
-    ax2.hist(phacked, bins=10, color="red", alpha=0.7, edgecolor="black", linewidth=1.5)
+    _bar(ax2, counts_phack, "red")
     ax2.axvspan(0.0, 0.01, alpha=0.2, color="blue", label="Highly Sig (p≤0.01)")
     ax2.axvspan(0.04, 0.05, alpha=0.2, color="red", label="Risky (0.04-0.05)")
     ax2.set_title("P-Hacked: INVERTED BUMP\n(Artificial clustering)", fontsize=12, fontweight="bold")
@@ -414,17 +447,9 @@ def visualize_comparison(save_path=None):
     ax2.legend()
     ax2.grid(alpha=0.3, axis="y")
 
-    plt.suptitle("Mathematical Signature of Data Integrity", fontsize=14, fontweight="bold")
-    plt.tight_layout()
-    if save_path:
-        fig.savefig(Path(save_path) / "figure2_shapes.png", dpi=150, bbox_inches="tight")
-        print(f"    ✓ Saved: figure2_shapes.png")
-    plt.show()
-    plt.close()
-
-    # Figure 3: Score mapping
-    print("\n[5] Creating Figure 3: Risk Ratio → Score Mapping...")
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    # Row 3: Score mapping
+    print("\n[5] Creating Row 3: Risk Ratio → Score Mapping...")
+    ax1, ax2 = axes[2]
 
     scenarios = ["Legitimate\n(Right-Skew)", "Borderline", "P-Hacked\n(Bump)"]
     risk_ratios = [0.1, 1.0, 5.0]
@@ -446,12 +471,12 @@ def visualize_comparison(save_path=None):
     ax2.axhline(y=40, color="red", linestyle="--", linewidth=1.5, alpha=0.7)
     ax2.grid(alpha=0.3, axis="y")
 
-    plt.suptitle("Scoring Formula Visualization", fontsize=14, fontweight="bold")
-    plt.tight_layout()
+    fig.suptitle("P-Curve Detection: Legitimate vs. P-Hacked", fontsize=14, fontweight="bold")
     if save_path:
-        fig.savefig(Path(save_path) / "figure3_scoring.png", dpi=150, bbox_inches="tight")
-        print(f"    ✓ Saved: figure3_scoring.png")
-    plt.show()
+        fig.savefig(Path(save_path) / "figures.png", dpi=150)
+        print(f"    ✓ Saved: figures.png")
+    if save_path is None and _INTERACTIVE:
+        plt.show()
     plt.close()
 
     print("\n" + "=" * 80)